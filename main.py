@@ -1,41 +1,134 @@
+import functools
+import hashlib
+import importlib.metadata
 import json
 import os
+import re
+import stat
+import string
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
 
-EMOJI = {
-    "start": "🧭",
-    "scan": "🔍",
-    "ok": "✅",
-    "missing": "❌",
-    "unused": "🪶",
-    "failure": "🚨",
-    "info": "ℹ️",
-}
+try:
+    # orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-console = Console()
+EMOJI = SimpleNamespace(
+    start="🧭",
+    scan="🔍",
+    ok="✅",
+    missing="❌",
+    unused="🪶",
+    failure="🚨",
+    info="ℹ️",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _panel(renderable: str, *, title: str, border_style: str) -> "Panel":
+    """Build a fitted Rich panel, importing Rich's Panel on first use."""
+    from rich.panel import Panel
+
+    return Panel.fit(renderable, title=title, border_style=border_style)
+
+
+class BufferedConsole:
+    """Collect console output so it can be printed later in a fixed order."""
+
+    def __init__(self) -> None:
+        self._calls: List[Tuple[tuple, dict]] = []
+
+    def print(self, *args, **kwargs) -> None:
+        self._calls.append((args, kwargs))
+
+    def replay(self) -> None:
+        """Print the buffered output on the shared console."""
+        for args, kwargs in self._calls:
+            console().print(*args, **kwargs)
+
+
+# Static messages are formatted once at import time.
+MSG_STARTED = f"{EMOJI.start} [bold blue]Python Dependency Checker[/bold blue] started."
+MSG_DEPTRY_RUNNING = f"{EMOJI.scan} [bold cyan]Running deptry analysis...[/bold cyan]"
+MSG_DEPTRY_FAILED = f"{EMOJI.failure} [bold red]deptry failed to execute.[/bold red]"
+MSG_PIP_CHECK_RUNNING = f"{EMOJI.scan} [bold cyan]Running pip-check-reqs analysis...[/bold cyan]"
+MSG_PIP_CHECK_CACHED = f"{EMOJI.info} [cyan]Sources and requirements unchanged; reusing cached pip-check-reqs results.[/cyan]"
+MSG_PIP_CHECK_FAILED = f"{EMOJI.failure} [bold red]pip-check-reqs commands exited with an unexpected status.[/bold red]"
+MSG_AUTO_FIX = f"{EMOJI.info} [bold]Applying auto-fix...[/bold]"
+MSG_AUTO_FIX_NO_REQUIREMENTS = f"{EMOJI.failure} [bold red]Could not find a requirements file to auto-fix.[/bold red]"
+MSG_RERUN = f"{EMOJI.scan} [bold cyan]Re-running analysis after auto-fix...[/bold cyan]"
+MSG_ISSUES_DETECTED = f"{EMOJI.failure} [bold red]Dependency issues detected.[/bold red]"
+MSG_UNUSED_WARNING = f"{EMOJI.unused} [yellow]Unused dependencies detected (warnings only).[/yellow]"
+MSG_SUCCESS = f"{EMOJI.ok} [bold green]All checks completed successfully.[/bold green]"
+MSG_ALL_GOOD = f"{EMOJI.ok} [green]All good! No issues detected.[/green]"
+TABLE_TITLE = f"{EMOJI.info} Dependency Report"
+TABLE_MISSING_LABEL = f"{EMOJI.missing} Missing"
+TABLE_UNUSED_LABEL = f"{EMOJI.unused} Unused"
+SUMMARY_ALL_GOOD = f"- {EMOJI.ok} All dependencies look good!"
+
+# Deleting every allowed character leaves an empty string for valid names.
+_REMOVE_ALLOWED = str.maketrans("", "", string.ascii_letters + string.digits + "-_.")
+_SKIP_RE = re.compile(
+    r"(examining |missing requirements|unused requirements|extra requirements"
+    r"|configuration|results|to fix|hint:|warning)",
+    re.IGNORECASE,
+)
+_SKIP_PREFIXES = ("#", "=", "---")
+
+
+class DepCheckError(Exception):
+    """Raised by the analysis helpers to abort the run with a given exit code.
+
+    The failure has already been reported on the console when this is raised;
+    main() turns it into the process exit status.
+    """
+
+    def __init__(self, message: str, exit_code: int = 2) -> None:
+        super().__init__(message)
+        self.exit_code = exit_code
 
 
 def resolve_project_path(raw_path: str) -> Path:
     """Resolve and validate the project path."""
-    path = Path(raw_path).expanduser().resolve()
-    if not path.exists():
-        console.print(
-            f"{EMOJI['failure']} [bold red]Path '{path}' does not exist.[/bold red]"
+    if os.path.isabs(raw_path):
+        path = Path(raw_path)
+    else:
+        path = Path(raw_path).expanduser().resolve()
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        console().print(
+            f"{EMOJI.failure} [bold red]Path '{path}' does not exist.[/bold red]"
         )
-        sys.exit(2)
-    if not path.is_dir():
-        console.print(
-            f"{EMOJI['failure']} [bold red]Path '{path}' is not a directory.[/bold red]"
+        raise DepCheckError(f"Path '{path}' does not exist.")
+    except OSError as exc:
+        console().print(
+            f"{EMOJI.failure} [bold red]Path '{path}' cannot be accessed: {exc}[/bold red]"
         )
-        sys.exit(2)
+        raise DepCheckError(f"Path '{path}' cannot be accessed: {exc}") from exc
+    if not stat.S_ISDIR(mode):
+        console().print(
+            f"{EMOJI.failure} [bold red]Path '{path}' is not a directory.[/bold red]"
+        )
+        raise DepCheckError(f"Path '{path}' is not a directory.")
     return path
 
 
@@ -43,97 +136,110 @@ def run_command(command: List[str], cwd: Path | None = None) -> subprocess.Compl
     """Execute a command returning the completed process."""
     result = subprocess.run(
         command,
-        cwd=str(cwd) if cwd else None,
+        cwd=cwd,
         capture_output=True,
         text=True,
     )
     return result
 
 
-def parse_deptry_report(stdout: str) -> Tuple[List[str], List[str]]:
+def parse_deptry_report(
+    stdout: str, out: "Console | BufferedConsole | None" = None
+) -> Tuple[List[str], List[str]]:
     """Parse deptry JSON output and return lists of missing and unused modules."""
-    if not stdout.strip():
-        return [], []
-
     try:
-        data = json.loads(stdout)
+        missing, unused = _parse_deptry_report(stdout)
     except json.JSONDecodeError as exc:
-        console.print(
-            f"{EMOJI['failure']} [bold red]Unable to parse deptry output as JSON:[/bold red] {exc}"
+        out = out or console()
+        out.print(
+            f"{EMOJI.failure} [bold red]Unable to parse deptry output as JSON:[/bold red] {exc}"
         )
-        console.print(stdout)
-        sys.exit(2)
+        out.print(stdout)
+        raise DepCheckError(f"Unable to parse deptry output as JSON: {exc}") from exc
+    return list(missing), list(unused)
 
-    missing = [
-        item.get("module") or item.get("name") or str(item)
-        for item in data.get("missing", [])
-    ]
-    unused = [
-        item.get("module") or item.get("name") or str(item)
-        for item in data.get("unused", [])
-    ]
-    return missing, unused
 
+@functools.lru_cache(maxsize=64)
+def _parse_deptry_report(stdout: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Memoized worker for parse_deptry_report; returns immutable tuples."""
+    if not stdout.strip():
+        return (), ()
 
-def parse_pip_check_output(stdout: str) -> List[str]:
-    """Extract dependency names from pip-check-reqs output."""
-    modules: List[str] = []
-    for line in stdout.splitlines():
-        clean = line.strip()
-        if not clean:
-            continue
-        lowered = clean.lower()
-        if lowered.startswith(("examining ", "missing requirements", "unused requirements", "extra requirements")):
-            continue
-        if lowered.startswith(("configuration", "results", "to fix", "hint:", "warning")):
-            continue
-        if clean.startswith(("#", "=", "---")):
-            continue
-        if clean[0].isdigit() and ":" in clean:
-            continue
-        if clean.startswith(("- ", "* ")):
-            clean = clean[2:]
-        candidate = clean.split()[0].strip(",")
-        if not candidate:
-            continue
-        allowed_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.")
-        if all(char in allowed_chars for char in candidate):
-            modules.append(candidate)
-    return sorted(set(modules))
+    data = json_loads(stdout)
+    return _deptry_modules(data.get("missing", [])), _deptry_modules(data.get("unused", []))
 
 
-def run_deptry(path: Path) -> Tuple[List[str], List[str]]:
-    console.print(
-        f"{EMOJI['scan']} [bold cyan]Running deptry analysis...[/bold cyan]"
+def _deptry_modules(items: List[Dict[str, str]]) -> Tuple[str, ...]:
+    """Return the sorted, unique module names from a list of deptry issues."""
+    # deptry reports one entry per occurrence, so dedupe while sorting.
+    names = dict.fromkeys(
+        item.get("module") or item.get("name") or str(item) for item in items
     )
+    return tuple(sorted(names))
+
+
+def parse_pip_check_output(stdout: str) -> List[str]:
+    """Extract dependency names from pip-check-reqs output."""
+    return parse_pip_check_output_lines(stdout.splitlines())
+
+
+def parse_pip_check_output_lines(lines: Iterable[str]) -> List[str]:
+    """Extract dependency names from pip-check-reqs output already split into lines."""
+    modules = [candidate for candidate in map(_pip_check_candidate, lines) if candidate]
+    return sorted(dict.fromkeys(modules))
+
+
+def _pip_check_candidate(line: str) -> str | None:
+    """Return the dependency name reported on a single output line, if any."""
+    clean = line.strip()
+    if not clean:
+        return None
+    if _SKIP_RE.match(clean) or clean.startswith(_SKIP_PREFIXES):
+        return None
+    if clean[0].isdigit() and ":" in clean:
+        return None
+    if clean.startswith(("- ", "* ")):
+        clean = clean[2:]
+    candidate = clean.split()[0].strip(",")
+    if not candidate or candidate.translate(_REMOVE_ALLOWED):
+        return None
+    return candidate
+
+
+def run_deptry(
+    path: Path, out: "Console | BufferedConsole | None" = None
+) -> Tuple[List[str], List[str]]:
+    out = out or console()
+    out.print(MSG_DEPTRY_RUNNING)
     tmp_path: Path | None = None
     try:
         fd, filename = tempfile.mkstemp(prefix="deptry_", suffix=".json")
         os.close(fd)
         tmp_path = Path(filename)
-        command = ["deptry", str(path), "--json-output", str(tmp_path)]
+        path_arg = os.fspath(path)
+        command = ["deptry", path_arg, "--json-output", filename]
         result = run_command(command, cwd=path)
 
         if result.returncode in (0, 1):
             json_output = tmp_path.read_text(encoding="utf-8") if tmp_path.exists() else ""
-            missing, unused = parse_deptry_report(json_output)
+            missing, unused = parse_deptry_report(json_output, out)
             return missing, unused
 
         stderr_text = result.stderr or ""
         if "--json-output" in stderr_text and "No such option" in stderr_text:
-            fallback = run_command(["deptry", str(path), "--json"], cwd=path)
+            fallback = run_command(["deptry", path_arg, "--json"], cwd=path)
             if fallback.returncode not in (0, 1):
-                console.print(f"{EMOJI['failure']} [bold red]deptry failed to execute.[/bold red]")
+                out.print(MSG_DEPTRY_FAILED)
                 if fallback.stderr:
-                    console.print(Panel.fit(fallback.stderr, title="deptry stderr", border_style="red"))
-                sys.exit(fallback.returncode or 2)
-            missing, unused = parse_deptry_report(fallback.stdout)
+                    out.print(_panel(fallback.stderr, title="deptry stderr", border_style="red"))
+                raise DepCheckError("deptry failed to execute.", fallback.returncode or 2)
+            missing, unused = parse_deptry_report(fallback.stdout, out)
             return missing, unused
 
-        console.print(f"{EMOJI['failure']} [bold red]deptry failed to execute.[/bold red]")
+        out.print(MSG_DEPTRY_FAILED)
         if stderr_text:
-            console.print(Panel.fit(stderr_text, title="deptry stderr", border_style="red"))
-        sys.exit(result.returncode or 2)
+            out.print(_panel(stderr_text, title="deptry stderr", border_style="red"))
+        raise DepCheckError("deptry failed to execute.", result.returncode or 2)
     finally:
         if tmp_path and tmp_path.exists():
             try:
@@ -142,36 +248,137 @@ def run_deptry(path: Path) -> Tuple[List[str], List[str]]:
                 pass
 
 
+REQUIREMENTS_CANDIDATES = ("requirements.txt", "requirements-dev.txt", "requirements.in")
+
+
+@functools.lru_cache(maxsize=32)
 def select_requirements_file(path: Path) -> Path | None:
-    """Pick a requirements file when available."""
-    candidates = [
-        path / "requirements.txt",
-        path / "requirements-dev.txt",
-        path / "requirements.in",
-    ]
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
+    """Pick a requirements file when available.
+
+    The result is cached for the lifetime of the process, which assumes the
+    project directory does not gain or lose requirements files during a run.
+    """
+    try:
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        # Directories that can be traversed but not listed still allow probing
+        # each candidate directly.
+        for name in REQUIREMENTS_CANDIDATES:
+            if (path / name).is_file():
+                return path / name
+        return None
+    for name in REQUIREMENTS_CANDIDATES:
+        if name in names:
+            return path / name
     return None
 
 
-def run_pip_check_reqs(path: Path) -> Tuple[List[str], List[str], Dict[str, str]]:
-    console.print(
-        f"{EMOJI['scan']} [bold cyan]Running pip-check-reqs analysis...[/bold cyan]"
-    )
+def collect_python_files(path: Path) -> List[Tuple[str, os.stat_result]]:
+    """Collect every .py file under path with its stat result, without following symlinks."""
+    found: List[Tuple[str, os.stat_result]] = []
+    pending = [os.fspath(path)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                        found.append((entry.path, entry.stat(follow_symlinks=False)))
+        except OSError:
+            continue
+    return found
+
+
+def pip_check_cache_key(path: Path, requirements: Path | None) -> str:
+    """Fingerprint the project sources, requirements file and environment for result caching."""
+    digest = hashlib.blake2b(digest_size=16)
+    # Both tools resolve imports against the installed distributions, so the
+    # interpreter, the pip-check-reqs release and the import path directories
+    # (whose mtimes change when packages are installed or removed) are part
+    # of the key.
+    try:
+        tool_version = importlib.metadata.version("pip-check-reqs")
+    except importlib.metadata.PackageNotFoundError:
+        tool_version = "unknown"
+    digest.update(f"{sys.prefix}\0{sys.version}\0{tool_version}\n".encode())
+    for entry in sys.path:
+        try:
+            digest.update(f"{entry}\0{os.stat(entry).st_mtime_ns}\n".encode())
+        except OSError:
+            continue
+    for filename, stat_result in sorted(collect_python_files(path)):
+        digest.update(f"{filename}\0{stat_result.st_mtime_ns}\0{stat_result.st_size}\n".encode())
+    if requirements:
+        digest.update(os.fsencode(requirements) + b"\0")
+        digest.update(requirements.read_bytes())
+    return digest.hexdigest()
+
+
+def load_cached_pip_check(
+    cache_file: Path,
+) -> Tuple[List[str], List[str], Dict[str, str]] | None:
+    """Return cached pip-check-reqs findings and diagnostics, or None when unavailable."""
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        return list(data["missing"]), list(data["unused"]), dict(data["diagnostics"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store_cached_pip_check(
+    cache_file: Path, missing: List[str], unused: List[str], diagnostics: Dict[str, str]
+) -> None:
+    """Persist pip-check-reqs findings; caching failures are never fatal."""
+    payload = {"missing": missing, "unused": unused, "diagnostics": diagnostics}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(payload), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def run_pip_check_reqs(
+    path: Path, out: "Console | BufferedConsole | None" = None
+) -> Tuple[List[str], List[str], Dict[str, str]]:
+    out = out or console()
+    out.print(MSG_PIP_CHECK_RUNNING)
     requirements = select_requirements_file(path)
+
+    cache_file: Path | None = None
+    cache_dir = os.getenv("DEPCHECK_CACHE_DIR")
+    if cache_dir:
+        try:
+            key = pip_check_cache_key(path, requirements)
+        except OSError:
+            # An unreadable requirements file only disables caching; the tools
+            # still run and report the problem themselves.
+            key = None
+        if key:
+            cache_file = Path(cache_dir).expanduser() / f"pip-check-reqs-{key}.json"
+            cached = load_cached_pip_check(cache_file)
+            if cached is not None:
+                out.print(MSG_PIP_CHECK_CACHED)
+                return cached
+
     command_suffix: List[str] = []
     if requirements:
-        command_suffix = ["--requirements-file", str(requirements)]
+        command_suffix = ["--requirements-file", os.fspath(requirements)]
 
-    missing_cmd = ["pip-missing-reqs", str(path)]
-    extra_cmd = ["pip-extra-reqs", str(path)]
+    path_arg = os.fspath(path)
+    missing_cmd = ["pip-missing-reqs", path_arg]
+    extra_cmd = ["pip-extra-reqs", path_arg]
     if command_suffix:
         missing_cmd.extend(command_suffix)
         extra_cmd.extend(command_suffix)
 
-    missing_result = run_command(missing_cmd, cwd=path)
-    extra_result = run_command(extra_cmd, cwd=path)
+    # Both tools are independent subprocesses, so run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        missing_future = executor.submit(run_command, missing_cmd, cwd=path)
+        extra_future = executor.submit(run_command, extra_cmd, cwd=path)
+        missing_result = missing_future.result()
+        extra_result = extra_future.result()
 
     diagnostics: Dict[str, str] = {}
     if missing_result.stderr:
@@ -180,57 +387,96 @@ def run_pip_check_reqs(path: Path) -> Tuple[List[str], List[str], Dict[str, str]
         diagnostics["pip-extra-reqs"] = extra_result.stderr
 
     if missing_result.returncode not in (0, 1) or extra_result.returncode not in (0, 1):
-        console.print(
-            f"{EMOJI['failure']} [bold red]pip-check-reqs commands exited with an unexpected status.[/bold red]"
-        )
+        out.print(MSG_PIP_CHECK_FAILED)
         for title, stderr in diagnostics.items():
-            console.print(Panel.fit(stderr, title=f"{title} stderr", border_style="red"))
-        sys.exit(missing_result.returncode or extra_result.returncode or 2)
-
-    if missing_result.stdout.strip():
-        console.print(
-            Panel.fit(
-                missing_result.stdout.strip(),
-                title="pip-missing-reqs",
-                border_style="cyan",
-            )
-        )
-    if extra_result.stdout.strip():
-        console.print(
-            Panel.fit(
-                extra_result.stdout.strip(),
-                title="pip-extra-reqs",
-                border_style="cyan",
-            )
+            out.print(_panel(stderr, title=f"{title} stderr", border_style="red"))
+        raise DepCheckError(
+            "pip-check-reqs commands exited with an unexpected status.",
+            missing_result.returncode or extra_result.returncode or 2,
         )
 
-    missing = parse_pip_check_output(missing_result.stdout)
-    unused = parse_pip_check_output(extra_result.stdout)
+    # Split each output once and reuse the lines for both display and parsing.
+    missing_lines = missing_result.stdout.splitlines()
+    extra_lines = extra_result.stdout.splitlines()
+    for title, lines in (("pip-missing-reqs", missing_lines), ("pip-extra-reqs", extra_lines)):
+        body = "\n".join(line for line in lines if line.strip())
+        if body:
+            out.print(_panel(body, title=title, border_style="cyan"))
+
+    missing = parse_pip_check_output_lines(missing_lines)
+    unused = parse_pip_check_output_lines(extra_lines)
+    if cache_file:
+        store_cached_pip_check(cache_file, missing, unused, diagnostics)
+    return missing, unused, diagnostics
+
+
+def run_both(path: Path) -> Tuple[List[str], List[str], Dict[str, str]]:
+    """Run deptry and pip-check-reqs in parallel and merge their findings.
+
+    Each analyzer writes to its own buffer; the output is printed once both
+    have finished, deptry first, so the log does not depend on thread timing.
+    """
+    deptry_out = BufferedConsole()
+    pip_out = BufferedConsole()
+    # Both analyzers spend their time waiting on subprocesses, so threads suffice.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        deptry_future = executor.submit(run_deptry, path, deptry_out)
+        pip_future = executor.submit(run_pip_check_reqs, path, pip_out)
+
+    deptry_out.replay()
+    pip_out.replay()
+    deptry_missing, deptry_unused = deptry_future.result()
+    pip_missing, pip_unused, diagnostics = pip_future.result()
+
+    missing = sorted(dict.fromkeys(deptry_missing + pip_missing))
+    unused = sorted(dict.fromkeys(deptry_unused + pip_unused))
     return missing, unused, diagnostics
 
 
+def run_analysis(mode: str, path: Path) -> Tuple[List[str], List[str], Dict[str, str]]:
+    """Dispatch to the analyzer selected by mode."""
+    if mode == "deptry":
+        missing, unused = run_deptry(path)
+        return missing, unused, {}
+    if mode == "pip-check-reqs":
+        return run_pip_check_reqs(path)
+    if mode == "both":
+        return run_both(path)
+    console().print(
+        f"{EMOJI.failure} [bold red]Unsupported mode '{mode}'. Use 'deptry', 'pip-check-reqs' or 'both'.[/bold red]"
+    )
+    raise DepCheckError(f"Unsupported mode '{mode}'.")
+
+
 def render_table(missing: List[str], unused: List[str]) -> None:
-    """Display a summary table using Rich."""
-    table = Table(title=f"{EMOJI['info']} Dependency Report", header_style="bold magenta")
+    """Display a summary table using Rich.
+
+    Both lists are expected to be sorted already, as returned by the parsers.
+    When there is nothing to report a single line is printed instead.
+    """
+    if not missing and not unused:
+        console().print(MSG_ALL_GOOD)
+        return
+
+    from rich.table import Table
+
+    table = Table(title=TABLE_TITLE, header_style="bold magenta")
     table.add_column("Status", justify="center", style="bold")
     table.add_column("Packages", overflow="fold")
 
     if missing:
         table.add_row(
-            f"{EMOJI['missing']} Missing",
-            ", ".join(sorted(missing)),
+            TABLE_MISSING_LABEL,
+            ", ".join(missing),
             style="bold red",
         )
     if unused:
         table.add_row(
-            f"{EMOJI['unused']} Unused",
-            ", ".join(sorted(unused)),
+            TABLE_UNUSED_LABEL,
+            ", ".join(unused),
             style="yellow",
         )
-    if not missing and not unused:
-        table.add_row(f"{EMOJI['ok']} All good!", "No issues detected.", style="green")
-
-    console.print(table)
+    console().print(table)
 
 
 def auto_fix_dependencies(
@@ -240,20 +486,18 @@ def auto_fix_dependencies(
     if not missing and not unused:
         return
 
-    console.print(f"{EMOJI['info']} [bold]Applying auto-fix...[/bold]")
+    console().print(MSG_AUTO_FIX)
 
     pyproject_path = project_path / "pyproject.toml"
     if pyproject_path.exists():
-        console.print(
+        console().print(
             f"[yellow]Auto-fixing for pyproject.toml is not yet supported.[/yellow]"
         )
         return
 
     reqs_file_path = select_requirements_file(project_path)
     if not reqs_file_path or not reqs_file_path.exists():
-        console.print(
-            f"{EMOJI['failure']} [bold red]Could not find a requirements file to auto-fix.[/bold red]"
-        )
+        console().print(MSG_AUTO_FIX_NO_REQUIREMENTS)
         return
 
     fix_requirements(reqs_file_path, missing, unused)
@@ -261,8 +505,6 @@ def auto_fix_dependencies(
 
 def fix_requirements(path: Path, missing: List[str], unused: List[str]) -> None:
     """Add or remove dependencies from a requirements file."""
-    import re
-
     content = path.read_text(encoding="utf-8")
     lines = content.splitlines()
     new_lines = []
@@ -286,7 +528,7 @@ def fix_requirements(path: Path, missing: List[str], unused: List[str]) -> None:
         new_lines = lines
 
     if removed_deps:
-        console.print(
+        console().print(
             f"  - Removed unused dependencies: {', '.join(sorted(removed_deps))}"
         )
 
@@ -297,38 +539,58 @@ def fix_requirements(path: Path, missing: List[str], unused: List[str]) -> None:
             added_deps.append(dep)
 
     if added_deps:
-        console.print(f"  - Added missing dependencies: {', '.join(sorted(added_deps))}")
+        console().print(f"  - Added missing dependencies: {', '.join(sorted(added_deps))}")
 
     path.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
-    console.print(f"{EMOJI['ok']} [green]Fixed dependencies in {path}.[/green]")
+    console().print(f"{EMOJI.ok} [green]Fixed dependencies in {path}.[/green]")
 
 
 def write_summary(missing: List[str], unused: List[str], mode: str) -> None:
-    """Append a markdown summary to GITHUB_STEP_SUMMARY when available."""
+    """Append a markdown summary to GITHUB_STEP_SUMMARY when available.
+
+    Both lists are expected to be sorted already, as returned by the parsers.
+    """
     summary_path = os.getenv("GITHUB_STEP_SUMMARY")
     if not summary_path:
         return
 
     lines = [
-        f"## {EMOJI['info']} Python Dependency Checker ({mode})",
+        f"## {EMOJI.info} Python Dependency Checker ({mode})",
         "",
     ]
     if missing:
         lines.append(
-            f"- {EMOJI['missing']} **Missing dependencies**: {', '.join(sorted(missing))}"
+            f"- {EMOJI.missing} **Missing dependencies**: {', '.join(missing)}"
         )
     if unused:
         lines.append(
-            f"- {EMOJI['unused']} **Unused dependencies**: {', '.join(sorted(unused))}"
+            f"- {EMOJI.unused} **Unused dependencies**: {', '.join(unused)}"
         )
     if not missing and not unused:
-        lines.append(f"- {EMOJI['ok']} All dependencies look good!")
+        lines.append(SUMMARY_ALL_GOOD)
 
-    with open(summary_path, "a", encoding="utf-8") as summary_file:
-        summary_file.write("\n".join(lines) + "\n")
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+    fd = os.open(summary_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        # os.write may write less than requested; keep going until done.
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def main() -> None:
+    try:
+        exit_code = run_checks()
+    except DepCheckError as exc:
+        exit_code = exc.exit_code
+    if exit_code:
+        sys.exit(exit_code)
+
+
+def run_checks() -> int:
+    """Run the configured analysis from the action inputs and return the exit code."""
     raw_path = os.getenv("INPUT_PATH", ".")
     mode = os.getenv("INPUT_MODE", "deptry").strip().lower()
     fail_on_warn_raw = (
@@ -340,66 +602,42 @@ def main() -> None:
     auto_fix_raw = os.getenv("INPUT_AUTO_FIX", "false")
     auto_fix = auto_fix_raw.strip().lower() == "true"
 
-    console.print(
-        f"{EMOJI['start']} [bold blue]Python Dependency Checker[/bold blue] started."
-    )
-    console.print(
-        f"{EMOJI['info']} Checking [bold]{raw_path}[/bold] using [bold]{mode}[/bold] (fail-on-warn={fail_on_warn}, auto-fix={auto_fix})."
+    console().print(MSG_STARTED)
+    console().print(
+        f"{EMOJI.info} Checking [bold]{raw_path}[/bold] using [bold]{mode}[/bold] (fail-on-warn={fail_on_warn}, auto-fix={auto_fix})."
     )
 
     project_path = resolve_project_path(raw_path)
 
-    missing: List[str] = []
-    unused: List[str] = []
-    diagnostics: Dict[str, str] = {}
-
-    if mode == "deptry":
-        missing, unused = run_deptry(project_path)
-    elif mode == "pip-check-reqs":
-        missing, unused, diagnostics = run_pip_check_reqs(project_path)
-    else:
-        console.print(
-            f"{EMOJI['failure']} [bold red]Unsupported mode '{mode}'. Use 'deptry' or 'pip-check-reqs'.[/bold red]"
-        )
-        sys.exit(2)
+    missing, unused, diagnostics = run_analysis(mode, project_path)
 
     render_table(missing, unused)
     write_summary(missing, unused, mode)
 
     if auto_fix:
         auto_fix_dependencies(project_path, missing, unused)
-        console.print(
-            f"{EMOJI['scan']} [bold cyan]Re-running analysis after auto-fix...[/bold cyan]"
-        )
-        if mode == "deptry":
-            missing, unused = run_deptry(project_path)
-        elif mode == "pip-check-reqs":
-            missing, unused, diagnostics = run_pip_check_reqs(project_path)
+        console().print(MSG_RERUN)
+        missing, unused, diagnostics = run_analysis(mode, project_path)
         render_table(missing, unused)
 
     if diagnostics:
         for title, stderr in diagnostics.items():
-            console.print(
-                Panel.fit(stderr, title=f"{title} stderr", border_style="yellow")
+            console().print(
+                _panel(stderr, title=f"{title} stderr", border_style="yellow")
             )
 
     has_missing = bool(missing)
     has_unused = bool(unused)
 
     if has_missing or (has_unused and fail_on_warn):
-        console.print(
-            f"{EMOJI['failure']} [bold red]Dependency issues detected.[/bold red]"
-        )
-        sys.exit(1)
+        console().print(MSG_ISSUES_DETECTED)
+        return 1
 
     if has_unused and not fail_on_warn:
-        console.print(
-            f"{EMOJI['unused']} [yellow]Unused dependencies detected (warnings only).[/yellow]"
-        )
+        console().print(MSG_UNUSED_WARNING)
 
-    console.print(
-        f"{EMOJI['ok']} [bold green]All checks completed successfully.[/bold green]"
-    )
+    console().print(MSG_SUCCESS)
+    return 0
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import json
 import os
 import subprocess
+import threading
 from pathlib import Path
 
 import pytest
@@ -15,13 +16,32 @@ class DummyConsole:
         pass
 
 
+class RecordingConsole:
+    """Console stub that keeps every printed renderable in order."""
+
+    def __init__(self):
+        self.printed = []
+
+    def print(self, *args, **kwargs):
+        self.printed.extend(args)
+
+
 @pytest.fixture(autouse=True)
 def suppress_console(monkeypatch):
     """Replace the Rich console with a quiet stub for deterministic tests."""
-    monkeypatch.setattr(main, "console", DummyConsole())
+    quiet = DummyConsole()
+    monkeypatch.setattr(main, "console", lambda: quiet)
     yield
 
 
+@pytest.fixture
+def recorded_console(monkeypatch):
+    """Replace the Rich console with a stub that records printed output."""
+    recorder = RecordingConsole()
+    monkeypatch.setattr(main, "console", lambda: recorder)
+    return recorder.printed
+
+
 def test_resolve_project_path_valid(tmp_path):
     result = main.resolve_project_path(str(tmp_path))
     assert result == tmp_path.resolve()
@@ -29,8 +49,29 @@ def test_resolve_project_path_valid(tmp_path):
 
 def test_resolve_project_path_missing(monkeypatch, tmp_path):
     missing_path = tmp_path / "nonexistent"
-    with pytest.raises(SystemExit) as exc:
+    with pytest.raises(main.DepCheckError) as exc:
         main.resolve_project_path(str(missing_path))
+    assert exc.value.exit_code == 2
+
+
+def test_resolve_project_path_rejects_files(tmp_path):
+    target = tmp_path / "file.txt"
+    target.write_text("", encoding="utf-8")
+    with pytest.raises(main.DepCheckError, match="not a directory"):
+        main.resolve_project_path(str(target))
+
+
+def test_resolve_project_path_reports_symlink_loops(tmp_path):
+    loop = tmp_path / "loop"
+    loop.symlink_to(loop)
+    with pytest.raises(main.DepCheckError, match="cannot be accessed"):
+        main.resolve_project_path(str(loop))
+
+
+def test_main_exits_with_error_code_for_invalid_path(monkeypatch, tmp_path):
+    monkeypatch.setenv("INPUT_PATH", str(tmp_path / "nonexistent"))
+    with pytest.raises(SystemExit) as exc:
+        main.main()
     assert exc.value.code == 2
 
 
@@ -44,6 +85,41 @@ def test_parse_deptry_report_handles_missing_and_unused():
     assert unused == ["boto3"]
 
 
+def test_parse_deptry_report_rejects_invalid_json():
+    with pytest.raises(main.DepCheckError) as exc:
+        main.parse_deptry_report("{not json")
+    assert exc.value.exit_code == 2
+
+
+def test_parse_deptry_report_sorts_and_dedupes():
+    report = {
+        "missing": [{"module": "requests"}, {"module": "httpx"}, {"module": "requests"}],
+        "unused": [],
+    }
+    missing, unused = main.parse_deptry_report(json.dumps(report))
+    assert missing == ["httpx", "requests"]
+    assert unused == []
+
+
+def test_parse_deptry_report_returns_fresh_lists_when_cached():
+    report = json.dumps({"missing": [{"module": "requests"}], "unused": []})
+    missing, _ = main.parse_deptry_report(report)
+    missing.append("mutated")
+    assert main.parse_deptry_report(report) == (["requests"], [])
+
+
+def test_parse_pip_check_output_filters_noise():
+    stdout = (
+        "Missing requirements:\n"
+        "src/app.py:3:0: dummy import\n"
+        "- requests\n"
+        "* boto3,\n"
+        "- not/a/package\n"
+        "- requests\n"
+    )
+    assert main.parse_pip_check_output(stdout) == ["boto3", "requests"]
+
+
 def test_run_deptry_collects_findings(monkeypatch, tmp_path):
     payload = {
         "missing": [{"module": "requests"}],
@@ -101,6 +177,22 @@ def test_run_deptry_fallbacks_to_legacy_flag(monkeypatch, tmp_path):
     assert any("--json" in call for call in calls)
 
 
+def test_select_requirements_file_prefers_requirements_txt(tmp_path):
+    (tmp_path / "requirements.in").write_text("requests\n", encoding="utf-8")
+    (tmp_path / "requirements.txt").write_text("requests\n", encoding="utf-8")
+    assert main.select_requirements_file(tmp_path) == tmp_path / "requirements.txt"
+
+
+def test_select_requirements_file_probes_when_listing_fails(monkeypatch, tmp_path):
+    (tmp_path / "requirements-dev.txt").write_text("pytest\n", encoding="utf-8")
+
+    def deny_scandir(path):
+        raise PermissionError(13, "Permission denied", str(path))
+
+    monkeypatch.setattr(main.os, "scandir", deny_scandir)
+    assert main.select_requirements_file(tmp_path) == tmp_path / "requirements-dev.txt"
+
+
 def test_run_pip_check_reqs_collects_missing_and_unused(monkeypatch, tmp_path):
     requirements = tmp_path / "requirements.txt"
     requirements.write_text("requests\n", encoding="utf-8")
@@ -127,6 +219,94 @@ def test_run_pip_check_reqs_collects_missing_and_unused(monkeypatch, tmp_path):
     assert diagnostics == {}
 
 
+def test_run_pip_check_reqs_reuses_cache_until_sources_change(monkeypatch, tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    source = project / "app.py"
+    source.write_text("import requests\n", encoding="utf-8")
+    monkeypatch.setenv("DEPCHECK_CACHE_DIR", str(tmp_path / "cache"))
+    calls: list[list[str]] = []
+
+    def fake_run_command(command, cwd=None):
+        calls.append(command)
+        tool = Path(command[0]).name
+        stdout = "- requests" if tool == "pip-missing-reqs" else ""
+        stderr = "warning: slow" if tool == "pip-extra-reqs" else ""
+        return subprocess.CompletedProcess(args=command, returncode=1, stdout=stdout, stderr=stderr)
+
+    monkeypatch.setattr(main, "run_command", fake_run_command)
+    first = main.run_pip_check_reqs(project)
+    second = main.run_pip_check_reqs(project)
+    assert first == second == (["requests"], [], {"pip-extra-reqs": "warning: slow"})
+    assert len(calls) == 2
+
+    source.write_text("import requests\nimport boto3\n", encoding="utf-8")
+    main.run_pip_check_reqs(project)
+    assert len(calls) == 4
+
+
+def test_run_pip_check_reqs_skips_cache_when_key_cannot_be_built(monkeypatch, tmp_path):
+    monkeypatch.setenv("DEPCHECK_CACHE_DIR", str(tmp_path / "cache"))
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("requests\n", encoding="utf-8")
+    real_read_bytes = Path.read_bytes
+
+    def unreadable(self):
+        if self == requirements:
+            raise PermissionError(13, "Permission denied", str(self))
+        return real_read_bytes(self)
+
+    def fake_run_command(command, cwd=None):
+        return subprocess.CompletedProcess(args=command, returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(Path, "read_bytes", unreadable)
+    monkeypatch.setattr(main, "run_command", fake_run_command)
+    assert main.run_pip_check_reqs(tmp_path) == ([], [], {})
+    assert not (tmp_path / "cache").exists()
+
+
+def test_run_analysis_both_merges_findings(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "run_deptry", lambda path, out=None: (["requests"], ["boto3"]))
+    monkeypatch.setattr(
+        main,
+        "run_pip_check_reqs",
+        lambda path, out=None: (["httpx", "requests"], [], {"pip-extra-reqs": "warning"}),
+    )
+    missing, unused, diagnostics = main.run_analysis("both", tmp_path)
+    assert missing == ["httpx", "requests"]
+    assert unused == ["boto3"]
+    assert diagnostics == {"pip-extra-reqs": "warning"}
+
+
+def test_run_analysis_both_prints_in_fixed_order(monkeypatch, tmp_path, recorded_console):
+    pip_done = threading.Event()
+
+    def fake_run_command(command, cwd=None):
+        tool = Path(command[0]).name
+        if tool == "deptry":
+            # Fail only after pip-check-reqs has finished, so unbuffered output
+            # would interleave the two analyzers.
+            assert pip_done.wait(timeout=5)
+            return subprocess.CompletedProcess(args=command, returncode=3, stdout="", stderr="boom")
+        if tool == "pip-extra-reqs":
+            pip_done.set()
+        return subprocess.CompletedProcess(args=command, returncode=0, stdout="- requests", stderr="")
+
+    monkeypatch.setattr(main, "run_command", fake_run_command)
+    with pytest.raises(main.DepCheckError) as exc:
+        main.run_analysis("both", tmp_path)
+    assert exc.value.exit_code == 3
+
+    messages = [item for item in recorded_console if isinstance(item, str)]
+    assert messages == [
+        main.MSG_DEPTRY_RUNNING,
+        main.MSG_DEPTRY_FAILED,
+        main.MSG_PIP_CHECK_RUNNING,
+    ]
+    # The deptry stderr panel comes before the pip-check-reqs output.
+    assert recorded_console.index(main.MSG_PIP_CHECK_RUNNING) == 3
+
+
 def test_main_successful_run(monkeypatch, tmp_path, tmp_path_factory):
     monkeypatch.setenv("INPUT_PATH", str(tmp_path))
     monkeypatch.setenv("INPUT_MODE", "deptry")
@@ -185,6 +365,18 @@ def test_main_fails_when_fail_on_warn_true(monkeypatch, tmp_path):
     assert exc.value.code == 1
 
 
+def test_render_table_skips_table_when_nothing_to_report(recorded_console):
+    main.render_table([], [])
+    assert recorded_console == [main.MSG_ALL_GOOD]
+
+
+def test_run_checks_returns_exit_code_for_missing(monkeypatch, tmp_path):
+    monkeypatch.setenv("INPUT_PATH", str(tmp_path))
+    monkeypatch.setenv("INPUT_MODE", "deptry")
+    monkeypatch.setattr(main, "run_deptry", lambda path: (["requests"], []))
+    assert main.run_checks() == 1
+
+
 def test_write_summary_handles_missing_file(monkeypatch, tmp_path):
     summary_path = tmp_path / "summary.md"
     monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary_path))